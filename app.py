@@ -1,57 +1,162 @@
+import functools
 import hashlib
-import json
+import itertools
+import multiprocessing
+import queue
+import ssl
+import struct
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from uuid import uuid4
+import orjson
 import requests
-from flask import Flask, jsonify, request, render_template, redirect, url_for, flash
+from requests.adapters import HTTPAdapter
+from flask import (Flask, Response, jsonify, request, render_template, redirect, url_for, flash,
+                   stream_with_context)
+from flask.json.provider import JSONProvider
 import sys
 import os
 
+# Upper bound on concurrent HTTP requests to peers
+MAX_PEER_REQUESTS = 32
+
+# Fixed-layout block header: index, difficulty, previous hash, timestamp in
+# milliseconds and Merkle root, followed by the nonce
+HEADER_PREFIX = struct.Struct('>QB32sQ32s')
+NONCE = struct.Struct('>Q')
+
+# A SHA-256 hex digest has 64 digits, so no hash can meet a higher difficulty
+MAX_DIFFICULTY = 64
+
 
 class Transaction:
     """Represents a blockchain transaction"""
     
+    # Slots keep the pending pool and chain compact and attribute access cheap
+    __slots__ = ('sender', 'recipient', 'amount', 'timestamp', '_dict_cache', '_json_bytes')
+    
     def __init__(self, sender, recipient, amount, timestamp=None):
         self.sender = sender
         self.recipient = recipient
         self.amount = amount
         self.timestamp = timestamp or time.time()
+        self._dict_cache = None
+        self._json_bytes = None
     
     def to_dict(self):
         """Convert transaction to dictionary"""
-        return {
-            'sender': self.sender,
-            'recipient': self.recipient,
-            'amount': self.amount,
-            'timestamp': self.timestamp
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'sender': self.sender,
+                'recipient': self.recipient,
+                'amount': self.amount,
+                'timestamp': self.timestamp
+            }
+        return self._dict_cache
+    
+    @property
+    def json_bytes(self):
+        """Canonical (sorted-key) JSON encoding, built once and reused for hashing"""
+        if self._json_bytes is None:
+            self._json_bytes = orjson.dumps(self.to_dict(), option=orjson.OPT_SORT_KEYS)
+        return self._json_bytes
     
     def __str__(self):
         return f"{self.sender} -> {self.recipient}: {self.amount}"
 
 
+def transaction_json(transaction):
+    """Canonical JSON bytes for a Transaction or a transaction dict from a peer"""
+    if isinstance(transaction, Transaction):
+        return transaction.json_bytes
+    return orjson.dumps(transaction, option=orjson.OPT_SORT_KEYS)
+
+
+def merkle_root_and_mutation(transactions):
+    """Merkle root of a list of transactions as 32 raw bytes, and whether the tree is mutated
+    
+    Leaves are SHA-256 hashes of each transaction's canonical JSON; each level
+    hashes adjacent pairs, duplicating the last node when the count is odd.
+    Because of that padding, [A, B, C] and [A, B, C, C] share a root, so a
+    level whose final pair is already equal marks the list as mutated.
+    """
+    if not transactions:
+        return bytes(32), False
+    
+    mutated = False
+    level = [hashlib.sha256(transaction_json(tx)).digest() for tx in transactions]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        elif level[-1] == level[-2]:
+            mutated = True
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    
+    return level[0], mutated
+
+
+def compute_merkle_root(transactions):
+    """Merkle root of a list of transactions, as 32 raw bytes"""
+    return merkle_root_and_mutation(transactions)[0]
+
+
 class Block:
     """Represents a blockchain block"""
     
-    def __init__(self, index, transactions, timestamp, previous_hash, nonce=0):
+    __slots__ = ('index', 'transactions', 'timestamp', 'previous_hash_bytes', 'nonce', 'difficulty',
+                 'merkle_root_bytes', '_hash')
+    
+    def __init__(self, index, transactions, timestamp, previous_hash, nonce=0, merkle_root=None, difficulty=0):
         self.index = index
         self.transactions = transactions
         self.timestamp = timestamp
-        self.previous_hash = previous_hash
+        # Hashes are kept as raw bytes for the binary header, hex is derived for the API
+        self.previous_hash_bytes = bytes.fromhex(previous_hash)
         self.nonce = nonce
+        self.difficulty = difficulty
+        # Peer blocks carry their claimed root; it is checked in Blockchain.verify_hash
+        if merkle_root is None:
+            self.merkle_root_bytes = compute_merkle_root(transactions)
+        else:
+            self.merkle_root_bytes = bytes.fromhex(merkle_root)
         self._hash = None
     
+    @property
+    def previous_hash(self):
+        """Hash of the previous block, as hex"""
+        return self.previous_hash_bytes.hex()
+    
+    @property
+    def merkle_root(self):
+        """Merkle root of the block's transactions, as hex"""
+        return self.merkle_root_bytes.hex()
+    
     def calculate_hash(self):
         """Calculate the hash of the block"""
-        block_string = json.dumps({
-            'index': self.index,
-            'transactions': [tx.to_dict() if isinstance(tx, Transaction) else tx for tx in self.transactions],
-            'timestamp': self.timestamp,
-            'previous_hash': self.previous_hash,
-            'nonce': self.nonce
-        }, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return hashlib.sha256(self.header_template() + NONCE.pack(self.nonce)).hexdigest()
+    
+    def header_template(self):
+        """Binary block header up to, but not including, the nonce.
+        
+        The header is a fixed ``HEADER_PREFIX`` struct followed by the 8-byte
+        nonce, committing to the transactions through the Merkle root only.
+        Hashing ``prefix + NONCE.pack(nonce)`` gives the block hash for that
+        nonce.
+        """
+        return HEADER_PREFIX.pack(
+            self.index,
+            self.difficulty,
+            self.previous_hash_bytes,
+            round(self.timestamp * 1000),
+            self.merkle_root_bytes
+        )
+    
+    @property
+    def target(self):
+        """Integer proof-of-work target for the block's difficulty"""
+        return difficulty_target(self.difficulty)
     
     @property
     def hash(self):
@@ -68,26 +173,193 @@ class Block:
             'timestamp': self.timestamp,
             'previous_hash': self.previous_hash,
             'nonce': self.nonce,
+            'merkle_root': self.merkle_root,
+            'difficulty': self.difficulty,
             'hash': self.hash
         }
 
 
+def difficulty_target(difficulty):
+    """Integer proof-of-work target for a difficulty.
+    
+    A hash has `difficulty` leading hex zeros exactly when its digest, read
+    as a big-endian integer, is below this value.
+    """
+    return 1 << (256 - difficulty * 4)
+
+
+def mine_nonce(prefix, target, start_nonce=0, count=None):
+    """Search a range of nonces for a block hash below the integer `target`.
+    
+    `prefix` comes from ``Block.header_template``. The SHA-256 state after
+    its first 64-byte block is computed once and copied for every attempt,
+    so each nonce costs a single compression of the header's tail.
+    Scans `count` nonces from `start_nonce` (unbounded if None) and returns
+    ``(nonce, hash)``, or None if the range holds no solution.
+    """
+    # Bind the hot-loop callables locally to skip attribute lookups per nonce
+    copy_midstate = hashlib.sha256(prefix).copy
+    pack_nonce = NONCE.pack
+    from_bytes = int.from_bytes
+    # A digest whose first byte exceeds the target's is always above the
+    # target, so most attempts are rejected without building a 256-bit int
+    target_top_byte = target >> 248
+    nonces = itertools.count(start_nonce) if count is None else range(start_nonce, start_nonce + count)
+    
+    for nonce in nonces:
+        h = copy_midstate()
+        h.update(pack_nonce(nonce))
+        digest = h.digest()
+        if digest[0] <= target_top_byte and from_bytes(digest, 'big') < target:
+            return nonce, digest.hex()
+    
+    return None
+
+
+def detect_cpu_features():
+    """Return the SHA-256 related CPU features listed in /proc/cpuinfo"""
+    flags = set()
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            for line in cpuinfo:
+                # x86 lists 'flags', ARM lists 'Features'
+                key, _, value = line.partition(':')
+                if key.strip() in ('flags', 'Features'):
+                    flags = set(value.split())
+                    break
+    except OSError:
+        pass
+    
+    return [name for flag, name in (('sha_ni', 'SHA-NI'), ('avx2', 'AVX2'), ('sha2', 'ARMv8 SHA2'))
+            if flag in flags]
+
+
+def sha256_backend_name():
+    """Describe the SHA-256 implementation used for mining
+    
+    hashlib is backed by OpenSSL when available, which selects its SHA-NI,
+    AVX2 or ARMv8 code path at runtime; otherwise Python's builtin C
+    implementation is used.
+    """
+    if hashlib.sha256.__name__.startswith('openssl_'):
+        backend = ssl.OPENSSL_VERSION
+    else:
+        backend = 'Python builtin'
+    
+    features = detect_cpu_features()
+    return f"{backend} ({', '.join(features) if features else 'generic'})"
+
+
+def ttl_cache(seconds):
+    """Cache a function's result for `seconds`, keyed on its arguments
+    
+    Only the most recent result is kept; callers pass a state version (or
+    similar) as an argument so that any change makes the entry stale.
+    """
+    def decorator(func):
+        latest = {}
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            cached = latest.get(args)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            
+            result = func(*args)
+            latest.clear()
+            latest[args] = (now + seconds, result)
+            return result
+        
+        return wrapper
+    return decorator
+
+
+def peer_session():
+    """HTTP session for a single peer, reusing its connection across requests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def map_peers(func, peers):
+    """Call `func` for every peer concurrently and return results in peer order"""
+    peers = list(peers)
+    if not peers:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_PEER_REQUESTS, len(peers))) as executor:
+        return list(executor.map(func, peers))
+
+
+# Id of the mining job in progress (0 when idle), shared with each mining
+# worker process by _init_mining_worker
+_active_mining_job = None
+
+
+def _init_mining_worker(active_job):
+    """Pool initializer for mining worker processes"""
+    global _active_mining_job
+    _active_mining_job = active_job
+
+
+def _mine_stride(prefix, target, start_nonce, n_workers, batch_size, job_id, worker_id):
+    """Scan every `n_workers`-th batch of nonces until job `job_id` is no longer active.
+    
+    The active job id is only read once per batch so workers don't contend on
+    it every nonce. Job ids are never reused, so workers left over from a
+    finished job stop at their next batch. A straggler that still finds a
+    nonce for an old job leaves the id of the current job in place.
+    """
+    batch_start = start_nonce + worker_id * batch_size
+    
+    while _active_mining_job.value == job_id:
+        result = mine_nonce(prefix, target, batch_start, batch_size)
+        if result is not None:
+            with _active_mining_job.get_lock():
+                if _active_mining_job.value == job_id:
+                    _active_mining_job.value = 0
+            return result
+        batch_start += n_workers * batch_size
+    
+    return None
+
+
 class Blockchain:
     """Main blockchain class"""
     
     def __init__(self):
         self.chain = []
         self.current_transactions = []
-        self.difficulty = 4  # Mining difficulty
+        self.difficulty = 4  # Mining difficulty for the next block
+        self.min_difficulty = 4
+        self.retarget_window = 20  # Blocks between difficulty adjustments
+        self.target_block_time = 10  # Seconds per block the difficulty aims for
         self.mining_reward = 10
-        self.nodes = set()
+        self.starting_balance = 100  # Balance of an address with no transactions
+        self.mining_batch_size = 4096  # Nonces scanned per mine_nonce call
+        self.mining_workers = os.cpu_count() or 1  # Processes used for Proof of Work
+        # Expected hashes per block (16 ** difficulty) from which mining is worth spreading
+        # across processes; easier blocks finish faster than the work can be handed out
+        self.parallel_mining_threshold = 16 ** 5
+        self._mining_pool = None  # Started on first parallel mining run, kept for the process lifetime
+        self._mining_pool_lock = threading.Lock()
+        self._mining_pool_size = 0
+        self._active_mining_job = None
+        self._last_mining_job = 0
+        self.nodes = {}  # Peer address -> keep-alive requests.Session
+        self._balances = {}  # Running balance per address, kept in step with the chain
+        self.version = 0  # Bumped on every state change; used as a cache key
+        self.lock = threading.RLock()  # Guards chain, pending transactions and nodes
         
         # Create genesis block
         self.create_genesis_block()
     
     def create_genesis_block(self):
         """Create the first block in the chain"""
-        genesis_block = Block(0, [], time.time(), "0")
+        genesis_block = Block(0, [], time.time(), "0" * 64, difficulty=self.difficulty)
         genesis_block._hash = genesis_block.calculate_hash()
         self.chain.append(genesis_block)
     
@@ -98,142 +370,423 @@ class Blockchain:
     def add_transaction(self, sender, recipient, amount):
         """Add a new transaction to the pending transactions"""
         transaction = Transaction(sender, recipient, amount)
-        self.current_transactions.append(transaction)
-        return self.get_latest_block().index + 1
+        with self.lock:
+            self.current_transactions.append(transaction)
+            self.version += 1
+            return self.get_latest_block().index + 1
     
     def mine_pending_transactions(self, mining_reward_address):
-        """Mine a new block with pending transactions"""
-        # Add mining reward transaction
-        reward_transaction = Transaction(None, mining_reward_address, self.mining_reward)
-        self.current_transactions.append(reward_transaction)
-        
-        # Create new block
-        block = Block(
-            index=len(self.chain),
-            transactions=self.current_transactions,
-            timestamp=time.time(),
-            previous_hash=self.get_latest_block().hash
-        )
-        
-        # Mine the block (Proof of Work)
-        self.mine_block(block)
+        """Mine a new block with pending transactions
         
-        # Add block to chain and reset pending transactions
-        self.chain.append(block)
-        self.current_transactions = []
-        
-        return block
+        The chain lock is held while the block is assembled and appended but
+        not during Proof of Work, so the node keeps serving requests. If the
+        chain changes underneath (e.g. consensus replaced it), the block is
+        rebuilt on the new tip and mined again.
+        """
+        while True:
+            with self.lock:
+                # Add mining reward transaction
+                reward_transaction = Transaction(None, mining_reward_address, self.mining_reward)
+                transactions = self.current_transactions + [reward_transaction]
+                previous_block = self.get_latest_block()
+                
+                # Create new block
+                block = Block(
+                    index=len(self.chain),
+                    transactions=transactions,
+                    timestamp=time.time(),
+                    previous_hash=previous_block.hash,
+                    difficulty=self.difficulty
+                )
+            
+            # Mine the block (Proof of Work)
+            self.mine_block(block)
+            
+            with self.lock:
+                if self.get_latest_block() is not previous_block:
+                    continue
+                
+                # Add block to chain and drop the mined transactions from the pending pool;
+                # transactions submitted while mining stay pending
+                self.chain.append(block)
+                self._apply_block_balances(block)
+                del self.current_transactions[:len(transactions) - 1]
+                self.retarget()
+                self.version += 1
+                
+                return block
     
     def mine_block(self, block):
         """Mine a block using Proof of Work"""
-        target = "0" * self.difficulty
-        
         print(f"Mining block {block.index}...")
         start_time = time.time()
         
-        while block.hash[:self.difficulty] != target:
-            block.nonce += 1
-            block._hash = None  # Reset hash to recalculate
+        prefix = block.header_template()
+        expected_hashes = (1 << 256) // block.target
+        if self.mining_workers > 1 and expected_hashes >= self.parallel_mining_threshold:
+            block.nonce, block._hash = self._mine_parallel(prefix, block.target, block.nonce)
+        else:
+            result = None
+            while result is None:
+                result = mine_nonce(prefix, block.target, block.nonce, self.mining_batch_size)
+                if result is None:
+                    block.nonce += self.mining_batch_size
+            block.nonce, block._hash = result
         
         end_time = time.time()
         print(f"Block {block.index} mined in {end_time - start_time:.2f} seconds with nonce {block.nonce}")
         print(f"Block hash: {block.hash}")
     
-    def is_chain_valid(self, chain=None):
-        """Validate the blockchain"""
+    def _mine_parallel(self, prefix, target, start_nonce):
+        """Split the nonce search across the processes of the mining pool"""
+        with self._mining_pool_lock:
+            if self._mining_pool is None:
+                # Workers come from a fork server (or are spawned) rather than being
+                # forked from this multithreaded process
+                start_methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in start_methods else 'spawn')
+                self._active_mining_job = context.Value('Q', 0)
+                self._mining_pool = context.Pool(self.mining_workers, initializer=_init_mining_worker,
+                                                 initargs=(self._active_mining_job,))
+                self._mining_pool_size = self.mining_workers
+            
+            n_workers = self._mining_pool_size
+            self._last_mining_job += 1
+            job_id = self._last_mining_job
+            self._active_mining_job.value = job_id
+            worker = functools.partial(_mine_stride, prefix, target, start_nonce,
+                                       n_workers, self.mining_batch_size, job_id)
+            
+            try:
+                for result in self._mining_pool.imap_unordered(worker, range(n_workers)):
+                    if result is not None:
+                        return result
+            finally:
+                # Stop any workers still scanning for this job
+                with self._active_mining_job.get_lock():
+                    if self._active_mining_job.value == job_id:
+                        self._active_mining_job.value = 0
+        
+        raise RuntimeError('Mining workers stopped without finding a nonce')
+    
+    def next_difficulty(self, chain=None, height=None):
+        """Difficulty required for the block at `height` (default: the next block)
+        
+        Every `retarget_window` blocks the difficulty moves one step towards
+        `target_block_time`, based on the median block time over the window.
+        In between it carries over from the previous block.
+        """
         if chain is None:
             chain = self.chain
+        if height is None:
+            height = len(chain)
         
-        for i in range(1, len(chain)):
-            current_block = chain[i]
-            previous_block = chain[i-1]
-            
-            # Check if current block hash is valid
-            if current_block.hash != current_block.calculate_hash():
-                return False
+        difficulty = chain[height - 1].difficulty
+        
+        if height % self.retarget_window == 0:
+            window = chain[max(0, height - self.retarget_window - 1):height]
+            block_times = sorted(b.timestamp - a.timestamp for a, b in zip(window, window[1:]))
+            median_time = block_times[len(block_times) // 2]
             
-            # Check if previous hash matches
-            if current_block.previous_hash != previous_block.hash:
+            if median_time < self.target_block_time / 2:
+                difficulty += 1
+            elif median_time > self.target_block_time * 2:
+                difficulty -= 1
+        
+        return max(self.min_difficulty, difficulty)
+    
+    def retarget(self):
+        """Set the difficulty for the next block from recent block times"""
+        self.difficulty = self.next_difficulty()
+    
+    def verify_link(self, previous_block, current_block):
+        """Check a block's link to its predecessor and its proof of work, using cached hashes"""
+        # Check if previous hash matches
+        if current_block.previous_hash != previous_block.hash:
+            return False
+        
+        # Check proof of work; difficulties past MAX_DIFFICULTY have no target
+        difficulty = current_block.difficulty
+        if not isinstance(difficulty, int) or not 0 <= difficulty <= MAX_DIFFICULTY:
+            return False
+        try:
+            digest = bytes.fromhex(current_block.hash)
+        except (TypeError, ValueError):
+            return False
+        return len(digest) == 32 and int.from_bytes(digest, 'big') < current_block.target
+    
+    def verify_hash(self, block):
+        """Recompute a block's Merkle root and hash and compare them with the cached ones
+        
+        Blocks whose transaction list is a mutated Merkle tree (a duplicated
+        trailing pair) are rejected even though their root matches.
+        """
+        merkle_root, mutated = merkle_root_and_mutation(block.transactions)
+        return (not mutated
+                and block.merkle_root_bytes == merkle_root
+                and block.hash == block.calculate_hash())
+    
+    def is_chain_valid(self, chain=None, audit=False):
+        """Validate the blockchain
+        
+        Every link and proof of work is checked against the cached hashes.
+        Our own chain was hashed locally while mining, so its hashes are only
+        recomputed when `audit` is set. A peer chain has every block re-hashed,
+        genesis included, since any block we skip could have been forged.
+        """
+        own_chain = chain is None
+        if own_chain:
+            chain = self.chain
+        
+        for i in range(1, len(chain)):
+            if not self.verify_link(chain[i-1], chain[i]):
                 return False
             
-            # Check proof of work
-            if current_block.hash[:self.difficulty] != "0" * self.difficulty:
+            # Check the block was mined at the difficulty the chain required
+            if chain[i].difficulty != self.next_difficulty(chain, i):
                 return False
         
-        return True
+        if not own_chain:
+            to_rehash = range(len(chain))
+        elif audit:
+            to_rehash = range(1, len(chain))
+        else:
+            to_rehash = range(0)
+        
+        return all(self.verify_hash(chain[i]) for i in to_rehash)
     
     def get_balance(self, address):
         """Get balance for a specific address"""
-        balance = 100
+        return self._balances.get(address, self.starting_balance)
+    
+    def _apply_block_balances(self, block, balances=None):
+        """Update a balance ledger (default: the running one) with a block's transactions"""
+        if balances is None:
+            balances = self._balances
         
+        for transaction in block.transactions:
+            if isinstance(transaction, dict):
+                sender, recipient, amount = transaction['sender'], transaction['recipient'], transaction['amount']
+            else:
+                sender, recipient, amount = transaction.sender, transaction.recipient, transaction.amount
+            
+            balances[sender] = balances.get(sender, self.starting_balance) - amount
+            balances[recipient] = balances.get(recipient, self.starting_balance) + amount
+    
+    def _rebuild_balances(self):
+        """Recompute the balance ledger from the whole chain"""
+        # Built aside and swapped in whole, so lock-free readers in get_balance
+        # never see a partly rebuilt ledger
+        balances = {}
         for block in self.chain:
-            for transaction in block.transactions:
-                if isinstance(transaction, dict):
-                    if transaction['sender'] == address:
-                        balance -= transaction['amount']
-                    if transaction['recipient'] == address:
-                        balance += transaction['amount']
-                else:
-                    if transaction.sender == address:
-                        balance -= transaction.amount
-                    if transaction.recipient == address:
-                        balance += transaction.amount
-        
-        return balance
+            self._apply_block_balances(block, balances)
+        self._balances = balances
     
     def register_node(self, address):
         """Register a new node in the network"""
         parsed_url = urlparse(address)
         if parsed_url.netloc:
-            self.nodes.add(parsed_url.netloc)
+            node = parsed_url.netloc
         elif parsed_url.path:
-            self.nodes.add(parsed_url.path)
+            node = parsed_url.path
         else:
             raise ValueError('Invalid URL')
+        
+        with self.lock:
+            if node not in self.nodes:
+                self.nodes[node] = peer_session()
+            self.version += 1
+    
+    def _fetch_chain(self, node):
+        """Fetch a peer's chain as ``(length, blocks)``, or None if unavailable"""
+        try:
+            response = self.nodes[node].get(f'http://{node}/api/chain', timeout=5)
+            if response.status_code != 200:
+                return None
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError):
+            return None
+        
+        # Convert chain data back to Block objects for validation. Peers running an
+        # older version, or sending junk, are skipped rather than failing consensus
+        chain_objects = []
+        try:
+            for block_data in data['chain']:
+                block = Block(
+                    block_data['index'],
+                    block_data['transactions'],
+                    block_data['timestamp'],
+                    block_data['previous_hash'],
+                    block_data['nonce'],
+                    block_data['merkle_root'],
+                    block_data['difficulty']
+                )
+                block._hash = block_data['hash']
+                
+                # Packing checks index, difficulty, timestamp and nonce fit the header
+                block.header_template()
+                NONCE.pack(block.nonce)
+                
+                # Transactions must be usable by the balance ledger
+                for transaction in block.transactions:
+                    if not (isinstance(transaction['sender'], (str, type(None)))
+                            and isinstance(transaction['recipient'], str)
+                            and isinstance(transaction['amount'], (int, float))):
+                        return None
+                
+                chain_objects.append(block)
+        except (KeyError, TypeError, ValueError, OverflowError, struct.error):
+            return None
+        
+        # The claimed length is not trusted; only the blocks actually sent count
+        return len(chain_objects), chain_objects
     
     def resolve_conflicts(self):
         """Consensus algorithm: replace chain with longest valid chain in network"""
-        neighbours = self.nodes
         new_chain = None
         max_length = len(self.chain)
+        with self.lock:
+            nodes = list(self.nodes)
         
-        for node in neighbours:
-            try:
-                response = requests.get(f'http://{node}/api/chain', timeout=5)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    length = data['length']
-                    chain = data['chain']
-                    
-                    # Convert chain data back to Block objects for validation
-                    chain_objects = []
-                    for block_data in chain:
-                        block = Block(
-                            block_data['index'],
-                            block_data['transactions'],
-                            block_data['timestamp'],
-                            block_data['previous_hash'],
-                            block_data['nonce']
-                        )
-                        block._hash = block_data['hash']
-                        chain_objects.append(block)
-                    
-                    if length > max_length and self.is_chain_valid(chain_objects):
-                        max_length = length
-                        new_chain = chain_objects
-            except requests.RequestException:
+        # Peers are queried concurrently; validation stays sequential
+        for result in map_peers(self._fetch_chain, nodes):
+            if result is None:
                 continue
+            
+            length, chain_objects = result
+            if length > max_length and self.is_chain_valid(chain_objects):
+                max_length = length
+                new_chain = chain_objects
         
-        if new_chain:
-            self.chain = new_chain
-            return True
+        with self.lock:
+            # Our own chain may have grown while peers were queried
+            if new_chain and len(new_chain) > len(self.chain):
+                self.chain = new_chain
+                self._rebuild_balances()
+                self.retarget()
+                self.version += 1
+                return True
         
         return False
 
 
+class MiningJob:
+    """A queued request to mine the pending transactions"""
+    
+    def __init__(self, mining_reward_address):
+        self.id = uuid4().hex
+        self.mining_reward_address = mining_reward_address
+        self.status = 'queued'
+        self.block = None
+        self.error = None
+        self.mining_time = None
+        self._done = threading.Event()
+    
+    def wait(self, timeout=None):
+        """Block until the job has finished"""
+        return self._done.wait(timeout)
+    
+    def to_dict(self):
+        """Convert job to dictionary"""
+        job = {
+            'job_id': self.id,
+            'status': self.status
+        }
+        
+        if self.status == 'done':
+            block = self.block
+            job.update({
+                'message': 'New Block Forged',
+                'index': block.index,
+                'transactions': [tx.to_dict() for tx in block.transactions],
+                'nonce': block.nonce,
+                'previous_hash': block.previous_hash,
+                'hash': block.hash,
+                'mining_time': round(self.mining_time, 2)
+            })
+        elif self.status == 'failed':
+            job['error'] = self.error
+        
+        return job
+
+
+class MiningWorker:
+    """Runs mining jobs one at a time on a background thread"""
+    
+    def __init__(self, blockchain, max_jobs=100):
+        self.blockchain = blockchain
+        self.max_jobs = max_jobs  # Finished jobs kept for status polling
+        self.jobs = {}
+        self._jobs_lock = threading.Lock()  # Guards jobs across request threads
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, mining_reward_address):
+        """Queue a mining job and return it"""
+        job = MiningJob(mining_reward_address)
+        with self._jobs_lock:
+            self.jobs[job.id] = job
+            excess = len(self.jobs) - self.max_jobs
+            if excess > 0:
+                # Dicts keep insertion order, so this forgets the oldest finished jobs;
+                # queued and running jobs stay reachable until they finish
+                finished = [job_id for job_id, old_job in self.jobs.items() if old_job._done.is_set()]
+                for job_id in finished[:excess]:
+                    del self.jobs[job_id]
+        
+        self._ensure_started()
+        self._queue.put(job)
+        return job
+    
+    def get(self, job_id):
+        """Look up a job by id"""
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+    
+    def _ensure_started(self):
+        """Start the worker thread on first use"""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='mining-worker', daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            job.status = 'mining'
+            start_time = time.time()
+            
+            # Status is polled without a lock, so the result fields are filled
+            # in before the status that exposes them
+            try:
+                if not self.blockchain.current_transactions:
+                    raise ValueError('No transactions to mine')
+                block = self.blockchain.mine_pending_transactions(job.mining_reward_address)
+                job.mining_time = time.time() - start_time
+                job.block = block
+                job.status = 'done'
+            except Exception as e:
+                job.mining_time = time.time() - start_time
+                job.error = str(e)
+                job.status = 'failed'
+            
+            job._done.set()
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.secret_key = 'blockchain_secret_key_change_in_production'
 
 # Generate a globally unique address for this node
@@ -242,6 +795,9 @@ node_identifier = str(uuid4()).replace('-', '')
 # Instantiate the Blockchain
 blockchain = Blockchain()
 
+# Mining runs in the background so requests are not blocked during Proof of Work
+mining_worker = MiningWorker(blockchain)
+
 
 # =============================================================================
 # WEB ROUTES (Frontend Pages)
@@ -303,10 +859,10 @@ def balance_page():
 # API ROUTES (Backend Endpoints)
 # =============================================================================
 
-@app.route('/api/stats')
-def api_stats():
-    """Get blockchain statistics"""
-    return jsonify({
+@ttl_cache(seconds=0.5)
+def stats_snapshot(version):
+    """Blockchain statistics for a given `blockchain.version`"""
+    return {
         'chain_length': len(blockchain.chain),
         'pending_count': len(blockchain.current_transactions),
         'peer_count': len(blockchain.nodes),
@@ -315,16 +871,40 @@ def api_stats():
         'mining_reward': blockchain.mining_reward,
         'node_id': node_identifier,
         'is_valid': blockchain.is_chain_valid()
-    })
+    }
+
+@app.route('/api/stats')
+def api_stats():
+    """Get blockchain statistics"""
+    return jsonify(stats_snapshot(blockchain.version))
 
 @app.route('/api/chain')
 def api_chain():
     """Get the full blockchain"""
-    response = {
-        'chain': [block.to_dict() for block in blockchain.chain],
-        'length': len(blockchain.chain),
-    }
-    return jsonify(response)
+    # Snapshot the block list so blocks added mid-stream don't change the length
+    chain = list(blockchain.chain)
+    
+    def generate():
+        # Encode one block at a time instead of building the whole response in memory
+        yield b'{"length":%d,"chain":[' % len(chain)
+        for i, block in enumerate(chain):
+            yield (b',' if i else b'') + orjson.dumps(block.to_dict(), option=orjson.OPT_SORT_KEYS)
+        yield b']}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+@app.route('/api/audit')
+def api_audit():
+    """Fully validate the chain, recomputing every block hash"""
+    start_time = time.time()
+    is_valid = blockchain.is_chain_valid(audit=True)
+    end_time = time.time()
+    
+    return jsonify({
+        'is_valid': is_valid,
+        'chain_length': len(blockchain.chain),
+        'audit_time': round(end_time - start_time, 2)
+    })
 
 @app.route('/api/transactions', methods=['GET', 'POST'])
 def api_transactions():
@@ -372,25 +952,27 @@ def api_transactions():
 
 @app.route('/api/mine', methods=['POST'])
 def api_mine():
-    """Mine a new block"""
+    """Queue a new block for mining"""
     if not blockchain.current_transactions:
         return jsonify({'error': 'No transactions to mine'}), 400
     
-    # Mine the block
-    start_time = time.time()
-    block = blockchain.mine_pending_transactions(node_identifier)
-    end_time = time.time()
+    job = mining_worker.submit(node_identifier)
     
     response = {
-        'message': 'New Block Forged',
-        'index': block.index,
-        'transactions': [tx.to_dict() for tx in block.transactions],
-        'nonce': block.nonce,
-        'previous_hash': block.previous_hash,
-        'hash': block.hash,
-        'mining_time': round(end_time - start_time, 2)
+        'message': 'Mining job queued',
+        'job_id': job.id,
+        'status_url': url_for('api_mine_status', job_id=job.id)
     }
-    return jsonify(response), 200
+    return jsonify(response), 202
+
+@app.route('/api/mine/<job_id>')
+def api_mine_status(job_id):
+    """Get the status of a mining job"""
+    job = mining_worker.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown mining job'}), 404
+    
+    return jsonify(job.to_dict())
 
 @app.route('/api/nodes', methods=['GET', 'POST'])
 def api_nodes():
@@ -464,10 +1046,24 @@ def api_balance(address):
         'balance': balance
     })
 
-@app.route('/api/health')
-def api_health():
-    """Get node health information"""
-    health_info = {
+def probe_peer(peer):
+    """Check whether a peer node answers"""
+    try:
+        response = blockchain.nodes[peer].get(f"http://{peer}/api/chain", timeout=2)
+        return 'online' if response.status_code == 200 else 'error'
+    except requests.RequestException:
+        return 'offline'
+
+@ttl_cache(seconds=5)
+def peer_statuses(peers):
+    """Connectivity of a set of peers; network state changes slowly, so this is cached longer"""
+    peers = list(peers)
+    return dict(zip(peers, map_peers(probe_peer, peers)))
+
+@ttl_cache(seconds=0.5)
+def health_snapshot(version):
+    """Node health information for a given `blockchain.version`, without peer status"""
+    return {
         'node_id': node_identifier,
         'status': 'online',
         'chain_length': len(blockchain.chain),
@@ -477,17 +1073,14 @@ def api_health():
         'difficulty': blockchain.difficulty,
         'is_chain_valid': blockchain.is_chain_valid()
     }
+
+@app.route('/api/health')
+def api_health():
+    """Get node health information"""
+    health_info = dict(health_snapshot(blockchain.version))
     
     # Test peer connectivity
-    peer_status = {}
-    for peer in blockchain.nodes:
-        try:
-            response = requests.get(f"http://{peer}/api/chain", timeout=2)
-            peer_status[peer] = 'online' if response.status_code == 200 else 'error'
-        except requests.RequestException:
-            peer_status[peer] = 'offline'
-    
-    health_info['peer_status'] = peer_status
+    health_info['peer_status'] = peer_statuses(frozenset(blockchain.nodes))
     return jsonify(health_info)
 
 
@@ -534,11 +1127,14 @@ def mine_block():
         flash('No transactions to mine', 'error')
         return redirect(url_for('mining_page'))
     
-    try:
-        block = blockchain.mine_pending_transactions(node_identifier)
-        flash(f'Block #{block.index} mined successfully! Nonce: {block.nonce}', 'success')
-    except Exception as e:
-        flash(f'Mining failed: {str(e)}', 'error')
+    # Go through the worker so mining never runs twice at once
+    job = mining_worker.submit(node_identifier)
+    job.wait()
+    
+    if job.block is not None:
+        flash(f'Block #{job.block.index} mined successfully! Nonce: {job.block.nonce}', 'success')
+    else:
+        flash(f'Mining failed: {job.error}', 'error')
     
     return redirect(url_for('mining_page'))
 
@@ -615,6 +1211,7 @@ if __name__ == '__main__':
     print(f"Server: http://{host}:{port}/")
     print(f"API Base: http://{host}:{port}/api/")
     print(f"Debug Mode: {'ON' if debug else 'OFF'}")
+    print(f"SHA-256 Backend: {sha256_backend_name()}")
     print("🔗" * 30)
     
     try: